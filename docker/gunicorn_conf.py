@@ -0,0 +1,17 @@
+"""Gunicorn settings: one uvicorn worker process per CPU core"""
+import multiprocessing
+import os
+
+bind = "0.0.0.0:8000"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# The workers already cover the cores, so give each a single prediction
+# thread instead of a cpu_count-sized pool apiece. Set before the app is
+# preloaded, which is when router.py reads it.
+os.environ.setdefault("PREDICT_THREADS", "1")
+
+# Import the app (and sklearn) once in the master so workers share those
+# pages copy-on-write; each worker still loads and warms the models in
+# its own lifespan startup
+preload_app = True
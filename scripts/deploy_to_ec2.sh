@@ -78,10 +78,10 @@ fi
 # Train model locally first to ensure it works
 if [ "$MODEL_VERSION" == "v1" ]; then
     echo "🎯 Training v1 model locally..."
-    python3 src/training/pipelines/iris_pipeline.py
+    python3 -m src.training.pipelines.iris_pipeline
 elif [ "$MODEL_VERSION" == "v2" ]; then
     echo "🎯 Training v2 model locally..."
-    python3 src/training/train.py 2
+    python3 -m src.training.train 2
 else
     echo "❌ Invalid model version: $MODEL_VERSION"
     exit 1
@@ -128,10 +128,10 @@ export PATH="\$HOME/.local/bin:\$PATH"
 # Train the appropriate model
 if [ "\$MODEL_VERSION" == "v1" ]; then
     echo "🎯 Training v1 model on EC2..."
-    python3 src/training/pipelines/iris_pipeline.py
+    python3 -m src.training.pipelines.iris_pipeline
 elif [ "\$MODEL_VERSION" == "v2" ]; then
     echo "🎯 Training v2 model on EC2..."
-    python3 src/training/train.py 2
+    python3 -m src.training.train 2
     
     # Update registry to make v2 active
     echo "🔄 Updating model registry to activate v2..."
@@ -11,7 +11,7 @@ rm -f src/api/models/iris_v*.pkl
 
 # Train v1 model
 echo "📉 Training v1 model (poor performance by design)..."
-python src/training/pipelines/iris_pipeline.py
+python -m src.training.pipelines.iris_pipeline
 
 # Verify v1 model exists
 if [ ! -f "src/api/models/iris_v1.pkl" ]; then
@@ -1,10 +1,14 @@
 from fastapi import FastAPI
-from .router import router
+from fastapi.responses import ORJSONResponse
+from .router import router, lifespan
 
 app = FastAPI(
     title="Iris Model API v1",
     description="Initial ML API deployment with v1 model - demonstrating CI/CD pipeline",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # Encode responses with orjson (C) rather than the stdlib json module
+    default_response_class=ORJSONResponse
 )
 
 @app.get("/")
@@ -1,58 +1,261 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, ConfigDict, Field, conlist
+from sklearn.ensemble import RandomForestClassifier
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from collections import OrderedDict
+from typing import Annotated, Any, Dict, List, Union
+import asyncio
 import joblib
 import json
+import numpy as np
 import os
 from pathlib import Path
+import pickle
+import threading
 
 router = APIRouter()
 
+# Features are cast to float32 for the trees, so anything past its range
+# would overflow to inf; reject those along with inf/nan as a 422
+FLOAT32_MAX = float(np.finfo(np.float32).max)
+Feature = Annotated[float, Field(allow_inf_nan=False, ge=-FLOAT32_MAX, le=FLOAT32_MAX)]
+
+class IrisQuery(BaseModel):
+    """Flower measurements, validated as one record by pydantic-core"""
+    sepal_length: Feature
+    sepal_width: Feature
+    petal_length: Feature
+    petal_width: Feature
+
+class BatchRequest(BaseModel):
+    """Rows of [sepal_length, sepal_width, petal_length, petal_width]"""
+    rows: List[conlist(Feature, min_length=4, max_length=4)]
+
+# Response models pin the shape of the prediction responses in the OpenAPI
+# docs. FastAPI validates the returned dict against them before the app's
+# ORJSONResponse encodes it.
+class PredictionResponse(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+
+    model: str
+    prediction: Union[str, int]
+    accuracy: Union[float, str]
+    model_type: str
+    version: str
+
+class V2PredictionResponse(PredictionResponse):
+    improvement: str
+
+class BatchPredictionResponse(BaseModel):
+    model: str
+    predictions: List[Union[str, int]]
+    version: str
+
 # Constants
 MODEL_DIR = Path("src/api/models")
-SPECIES = {0: "setosa", 1: "versicolor", 2: "virginica"}
+REGISTRY_FILE = "model_registry.json"
+SPECIES = ("setosa", "versicolor", "virginica")
+MODEL_VERSIONS = ("v1", "v2")
+# Deployment-time model override; the environment doesn't change mid-process
+ENV_MODEL_VERSION = os.getenv("MODEL_VERSION")
+
+# Models deserialized once and shared by every request, keyed by version
+MODELS: Dict[str, Any] = {}
+
+# model.predict runs here so CPU-bound inference doesn't block the event
+# loop; sklearn releases the GIL while walking trees. PREDICT_THREADS sizes
+# the pool per process (gunicorn_conf.py sets it to 1 per worker); a lone
+# uvicorn process defaults to one thread per core.
+EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("PREDICT_THREADS") or os.cpu_count()))
+
+# Reused input row for single predictions, one per executor thread. float32
+# is the dtype sklearn's trees work in, so predict() skips the
+# list -> float64 -> float32 copies.
+_local = threading.local()
+
+# Memoized single predictions keyed on (version, *features), oldest first.
+# Only touched from the event loop, so hits never wait on the thread pool.
+PREDICTION_CACHE_SIZE = 4096
+_PREDICTIONS = OrderedDict()
+
+# Parsed registry, re-read only when the file's mtime changes
+_REGISTRY_CACHE = {"mtime": None, "data": {}}
 
 def load_registry():
-    """Load model registry"""
+    """Load model registry (cached until the file changes)"""
     try:
-        with open("model_registry.json", "r") as f:
-            return json.load(f)
+        mtime = os.stat(REGISTRY_FILE).st_mtime_ns
     except FileNotFoundError:
         return {}
+    
+    if _REGISTRY_CACHE["mtime"] != mtime:
+        try:
+            with open(REGISTRY_FILE, "r") as f:
+                _REGISTRY_CACHE["data"] = json.load(f)
+        except FileNotFoundError:
+            return {}
+        _REGISTRY_CACHE["mtime"] = mtime
+    return _REGISTRY_CACHE["data"]
 
-def get_active_model_version():
+def get_active_model_version(registry=None):
     """Get the active model version from environment or registry"""
     # Environment variable takes precedence
-    env_version = os.getenv("MODEL_VERSION")
-    if env_version:
-        return env_version
+    if ENV_MODEL_VERSION:
+        return ENV_MODEL_VERSION
     
     # Fall back to registry
+    if registry is None:
+        registry = load_registry()
+    return registry.get("version", "v1")
+
+# Versions with a model file on disk, re-scanned only when MODEL_DIR changes
+_AVAILABLE_CACHE = {"mtime": None, "versions": []}
+
+def get_available_models():
+    """List model versions present on disk (cached until MODEL_DIR changes)"""
     try:
-        with open("model_registry.json", "r") as f:
-            registry = json.load(f)
-            return registry.get("version", "v1")
+        mtime = os.stat(MODEL_DIR).st_mtime_ns
     except FileNotFoundError:
-        return "v1"
-
-def load_active_model():
-    """Load the currently active model"""
-    version = get_active_model_version()
-    model_file = f"iris_{version}.pkl"
-    model_path = MODEL_DIR / model_file
+        return []
     
+    if _AVAILABLE_CACHE["mtime"] != mtime:
+        _AVAILABLE_CACHE["versions"] = [
+            version for version in MODEL_VERSIONS
+            if (MODEL_DIR / f"iris_{version}.pkl").exists()
+        ]
+        _AVAILABLE_CACHE["mtime"] = mtime
+    return _AVAILABLE_CACHE["versions"]
+
+class ForestPredictor:
+    """RandomForestClassifier.predict without its per-call overhead
+
+    Calls each tree's compiled ``tree_.apply`` kernel directly and sums the
+    normalised leaf values, which is what ``predict`` does once it is done
+    with input validation and joblib dispatch - the part that dominates
+    single-row latency.
+    """
+
+    def __init__(self, forest):
+        self.classes_ = forest.classes_
+        self._trees = []
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            value = tree.value[:, 0, :]
+            self._trees.append((tree, value / value.sum(axis=1, keepdims=True)))
+
+    def predict(self, X):
+        # Values past the float32 range become inf here and are rejected
+        # just below, so the cast's overflow warning would only be noise
+        with np.errstate(over="ignore"):
+            X = np.ascontiguousarray(X, dtype=np.float32)
+        if not np.isfinite(X).all():
+            raise ValueError("Input X contains infinity or NaN, or a value too large for float32")
+        tree, value = self._trees[0]
+        proba = value[tree.apply(X)]
+        for tree, value in self._trees[1:]:
+            proba += value[tree.apply(X)]
+        return self.classes_.take(proba.argmax(axis=1))
+
+def compile_model(model):
+    """Swap in a faster predictor where one exists for the model type"""
+    if isinstance(model, RandomForestClassifier) and model.n_outputs_ == 1:
+        return ForestPredictor(model)
+    return model
+
+def load_model(model_path):
+    """Deserialize a model, preferring plain pickle over joblib
+
+    Plain pickle loads the v2 forest several times faster than
+    ``joblib.load``; joblib is kept for artifacts written with
+    ``joblib.dump``, whose numpy-aware format pickle can't read.
+    """
     try:
-        model = joblib.load(model_path)
+        with open(model_path, "rb") as f:
+            return pickle.load(f)
+    except pickle.UnpicklingError:
+        return joblib.load(model_path)
+
+def get_model(version):
+    """Return the cached model for a version, loading it on first use"""
+    model = MODELS.get(version)
+    if model is None:
+        model_path = MODEL_DIR / f"iris_{version}.pkl"
+        if not model_path.exists():
+            return None
+        model = MODELS[version] = compile_model(load_model(model_path))
+    return model
+
+@asynccontextmanager
+async def lifespan(app):
+    """Preload and warm up every available model once at startup"""
+    for version in MODEL_VERSIONS:
+        model = get_model(version)
+        if model is not None:
+            # Pay the first-call cost here rather than on the first request
+            await run_in_executor(model.predict, np.zeros((1, 4), dtype=np.float32))
+    app.state.models = MODELS
+    yield
+    MODELS.clear()
+    _PREDICTIONS.clear()
+
+async def predict_one(version, sepal_length, sepal_width, petal_length, petal_width):
+    """Predict a single flower with a loaded model version
+
+    The models are deterministic, so results are memoized on the version
+    and the four features; repeated queries skip model.predict and the
+    executor hop entirely. Only misses are sent to EXECUTOR.
+    """
+    key = (version, sepal_length, sepal_width, petal_length, petal_width)
+    pred_idx = _PREDICTIONS.get(key)
+    if pred_idx is not None:
+        _PREDICTIONS.move_to_end(key)
+        return pred_idx
+    
+    pred_idx = await run_in_executor(_predict_row, *key)
+    _PREDICTIONS[key] = pred_idx
+    if len(_PREDICTIONS) > PREDICTION_CACHE_SIZE:
+        _PREDICTIONS.popitem(last=False)
+    return pred_idx
+
+def _predict_row(version, sepal_length, sepal_width, petal_length, petal_width):
+    """Run one row through a model via this thread's feature buffer"""
+    model = MODELS[version]
+    features = getattr(_local, "features", None)
+    if features is None:
+        features = _local.features = np.empty((1, 4), dtype=np.float32)
+    features[0, 0] = sepal_length
+    features[0, 1] = sepal_width
+    features[0, 2] = petal_length
+    features[0, 3] = petal_width
+    return int(model.predict(features)[0])
+
+async def run_in_executor(func, *args):
+    """Run a CPU-bound call on the prediction thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(EXECUTOR, func, *args)
+
+def species_name(pred_idx):
+    """Map a class index to its species name, passing unknown indices through"""
+    return SPECIES[pred_idx] if 0 <= pred_idx < len(SPECIES) else pred_idx
+
+def load_active_model(registry=None):
+    """Load the currently active model"""
+    version = get_active_model_version(registry)
+    model = get_model(version)
+    if model is not None:
         return model, version
-    except FileNotFoundError:
-        # If environment specifies a version but model doesn't exist, raise error
-        if os.getenv("MODEL_VERSION"):
-            raise HTTPException(status_code=404, detail=f"Model {version} not found. Train it first with: make train-{version}")
-        
-        # Fallback to v1 if specified model not found
-        if version != "v1":
-            fallback_path = MODEL_DIR / "iris_v1.pkl"
-            if fallback_path.exists():
-                return joblib.load(fallback_path), "v1"
-        raise HTTPException(status_code=404, detail=f"Model {version} not found")
+    
+    # If environment specifies a version but model doesn't exist, raise error
+    if ENV_MODEL_VERSION:
+        raise HTTPException(status_code=404, detail=f"Model {version} not found. Train it first with: make train-{version}")
+    
+    # Fallback to v1 if specified model not found
+    if version != "v1":
+        fallback = get_model("v1")
+        if fallback is not None:
+            return fallback, "v1"
+    raise HTTPException(status_code=404, detail=f"Model {version} not found")
 
 @router.get("/health")
 async def health_check():
@@ -62,10 +265,9 @@ async def health_check():
 @router.get("/model-info")
 async def model_info():
     """Get current model information"""
-    active_version = get_active_model_version()
-    
-    # Load registry to get model metadata
+    # Load registry once for both the active version and model metadata
     registry = load_registry()
+    active_version = get_active_model_version(registry)
     
     # Determine model info based on active version
     if active_version == "v1":
@@ -80,11 +282,7 @@ async def model_info():
         if registry.get("version") == "v2":
             accuracy = registry.get("metrics", {}).get("accuracy", 0.95)
     
-    available_models = []
-    for version in ["v1", "v2"]:
-        model_path = MODEL_DIR / f"iris_{version}.pkl"
-        if model_path.exists():
-            available_models.append(version)
+    available_models = get_available_models()
     
     return {
         "active_model": f"iris_{active_version}.pkl",
@@ -92,19 +290,18 @@ async def model_info():
         "model_type": model_type,
         "accuracy": accuracy,
         "available_models": available_models,
-        "environment_override": os.getenv("MODEL_VERSION") is not None
+        "environment_override": ENV_MODEL_VERSION is not None
     }
 
-@router.get("/predict")
-async def predict(sepal_length: float, sepal_width: float, petal_length: float, petal_width: float):
+@router.get("/predict", response_model=PredictionResponse)
+async def predict(query: Annotated[IrisQuery, Query()]):
     """Main prediction endpoint - uses active model"""
-    model, version = load_active_model()
-    
-    features = [[sepal_length, sepal_width, petal_length, petal_width]]
-    prediction = model.predict(features)
-    pred_idx = int(prediction[0])
-    
     registry = load_registry()
+    model, version = load_active_model(registry)
+    
+    pred_idx = await predict_one(
+        version, query.sepal_length, query.sepal_width, query.petal_length, query.petal_width
+    )
     
     # Get accuracy from registry (actual calculated accuracy)
     accuracy = registry.get("metrics", {}).get("accuracy", "unknown")
@@ -112,23 +309,22 @@ async def predict(sepal_length: float, sepal_width: float, petal_length: float,
     
     return {
         "model": version,
-        "prediction": SPECIES.get(pred_idx, pred_idx),
+        "prediction": species_name(pred_idx),
         "accuracy": accuracy,
         "model_type": model_type,
         "version": f"{version}.0.0"
     }
 
-@router.get("/predict/v1")
-async def predict_v1(sepal_length: float, sepal_width: float, petal_length: float, petal_width: float):
+@router.get("/predict/v1", response_model=PredictionResponse)
+async def predict_v1(query: Annotated[IrisQuery, Query()]):
     """Specific v1 prediction endpoint"""
-    model_path = MODEL_DIR / "iris_v1.pkl"
-    if not model_path.exists():
+    model = get_model("v1")
+    if model is None:
         raise HTTPException(status_code=404, detail="Model v1 not found")
     
-    model = joblib.load(model_path)
-    features = [[sepal_length, sepal_width, petal_length, petal_width]]
-    prediction = model.predict(features)
-    pred_idx = int(prediction[0])
+    pred_idx = await predict_one(
+        "v1", query.sepal_length, query.sepal_width, query.petal_length, query.petal_width
+    )
     
     # Get v1 accuracy from registry
     registry = load_registry()
@@ -140,23 +336,22 @@ async def predict_v1(sepal_length: float, sepal_width: float, petal_length: floa
     
     return {
         "model": "v1",
-        "prediction": SPECIES.get(pred_idx, pred_idx),
+        "prediction": species_name(pred_idx),
         "accuracy": accuracy,
         "model_type": "DummyClassifier",
         "version": "1.0.0"
     }
 
-@router.get("/predict/v2")
-async def predict_v2(sepal_length: float, sepal_width: float, petal_length: float, petal_width: float):
+@router.get("/predict/v2", response_model=V2PredictionResponse)
+async def predict_v2(query: Annotated[IrisQuery, Query()]):
     """Specific v2 prediction endpoint"""
-    model_path = MODEL_DIR / "iris_v2.pkl"
-    if not model_path.exists():
+    model = get_model("v2")
+    if model is None:
         raise HTTPException(status_code=404, detail="Model v2 not found")
     
-    model = joblib.load(model_path)
-    features = [[sepal_length, sepal_width, petal_length, petal_width]]
-    prediction = model.predict(features)
-    pred_idx = int(prediction[0])
+    pred_idx = await predict_one(
+        "v2", query.sepal_length, query.sepal_width, query.petal_length, query.petal_width
+    )
     
     # Get v2 accuracy from registry  
     registry = load_registry()
@@ -167,9 +362,23 @@ async def predict_v2(sepal_length: float, sepal_width: float, petal_length: floa
     
     return {
         "model": "v2",
-        "prediction": SPECIES.get(pred_idx, pred_idx),
+        "prediction": species_name(pred_idx),
         "accuracy": accuracy,
         "model_type": "RandomForestClassifier",
         "version": "2.0.0",
         "improvement": "Major accuracy boost via CI/CD"
-    }
\ No newline at end of file
+    }
+
+@router.post("/predict/batch", response_model=BatchPredictionResponse)
+async def predict_batch(request: BatchRequest):
+    """Batch prediction endpoint - runs every row through the active model at once"""
+    model, version = load_active_model()
+    
+    features = np.asarray(request.rows, dtype=np.float32).reshape(-1, 4)
+    predictions = await run_in_executor(model.predict, features) if len(features) else []
+    
+    return {
+        "model": version,
+        "predictions": [species_name(int(p)) for p in predictions],
+        "version": f"{version}.0.0"
+    }
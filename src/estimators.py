@@ -0,0 +1,17 @@
+import numpy as np
+
+class MajorityClassifier:
+    """Always predicts the most frequent training label
+
+    Same predictions as DummyClassifier(strategy='most_frequent'), without
+    sklearn's input validation and bookkeeping on fit and predict. Kept
+    numpy-only so the API can unpickle it without the training code.
+    """
+
+    def fit(self, X, y):
+        labels, counts = np.unique(y, return_counts=True)
+        self.majority_ = labels[counts.argmax()]
+        return self
+
+    def predict(self, X):
+        return np.full(len(X), self.majority_, dtype=np.int8)
@@ -0,0 +1,9 @@
+import pytest
+from fastapi.testclient import TestClient
+from src.api.main import app
+
+@pytest.fixture(scope="session")
+def client():
+    """One client for the whole session, so models load once via the lifespan"""
+    with TestClient(app) as c:
+        yield c
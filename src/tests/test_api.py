@@ -1,9 +1,11 @@
-from fastapi.testclient import TestClient
-from src.api.main import app
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+import numpy as np
+import pytest
+import warnings
+from src.api.router import compile_model
 
-client = TestClient(app)
-
-def test_get_model_v1():
+def test_get_model_v1(client):
     response = client.get("/predict/v1", params={
         "sepal_length": 5.1,
         "sepal_width": 3.5,
@@ -12,3 +14,40 @@ def test_get_model_v1():
     })
     assert response.status_code == 200
     assert "prediction" in response.json()
+
+def test_predict_batch(client):
+    response = client.post("/predict/batch", json={
+        "rows": [[5.1, 3.5, 1.4, 0.2], [6.7, 3.0, 5.2, 2.3]]
+    })
+    assert response.status_code == 200
+    assert len(response.json()["predictions"]) == 2
+
+def test_predict_batch_invalid_row(client):
+    response = client.post("/predict/batch", json={"rows": [[5.1, 3.5, 1.4]]})
+    assert response.status_code == 422
+
+def test_predict_rejects_non_finite(client):
+    response = client.get("/predict/v1", params={
+        "sepal_length": 1e39,
+        "sepal_width": 3.5,
+        "petal_length": 1.4,
+        "petal_width": "nan"
+    })
+    assert response.status_code == 422
+
+def test_predict_batch_rejects_non_finite(client):
+    response = client.post("/predict/batch", json={"rows": [[1e39, 3.5, 1.4, 0.2]]})
+    assert response.status_code == 422
+
+def test_compiled_forest_matches_sklearn():
+    X, y = load_iris(return_X_y=True)
+    forest = RandomForestClassifier(n_estimators=10, random_state=42).fit(X, y)
+    assert (compile_model(forest).predict(X) == forest.predict(X)).all()
+
+def test_compiled_forest_rejects_non_finite():
+    X, y = load_iris(return_X_y=True)
+    forest = RandomForestClassifier(n_estimators=10, random_state=42).fit(X, y)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(ValueError):
+            compile_model(forest).predict(np.array([[1e39, 3.5, 1.4, 0.2]]))
@@ -0,0 +1,29 @@
+import json
+import pytest
+from src.training import artifacts
+
+REGISTRY = {
+    "active_model": "iris_v1.pkl",
+    "metrics": {"accuracy": 0.333},
+    "version": "v1",
+    "model_type": "DummyClassifier"
+}
+
+def write(tmp_path, monkeypatch, orjson):
+    registry_file = tmp_path / "model_registry.json"
+    monkeypatch.setattr(artifacts, "REGISTRY_FILE", registry_file)
+    monkeypatch.setattr(artifacts, "orjson", orjson)
+    artifacts.write_registry(REGISTRY)
+    return registry_file.read_bytes()
+
+def test_write_registry_with_orjson(tmp_path, monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    data = write(tmp_path, monkeypatch, orjson)
+    assert json.loads(data) == REGISTRY
+    assert not (tmp_path / "model_registry.json.tmp").exists()
+
+def test_write_registry_json_fallback_matches_orjson(tmp_path, monkeypatch):
+    data = write(tmp_path, monkeypatch, None)
+    assert data == json.dumps(REGISTRY, indent=2).encode()
+    orjson = pytest.importorskip("orjson")
+    assert data == orjson.dumps(REGISTRY, option=orjson.OPT_INDENT_2)
@@ -0,0 +1,63 @@
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from src.api import router
+
+def bump_mtime(path):
+    """Move mtime forward explicitly; back-to-back writes can share a tick"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+def test_registry_rewrite_is_picked_up(tmp_path, monkeypatch):
+    registry_file = tmp_path / "model_registry.json"
+    monkeypatch.setattr(router, "REGISTRY_FILE", str(registry_file))
+    monkeypatch.setattr(router, "_REGISTRY_CACHE", {"mtime": None, "data": {}})
+
+    assert router.load_registry() == {}
+    registry_file.write_text(json.dumps({"version": "v1"}))
+    assert router.load_registry() == {"version": "v1"}
+
+    registry_file.write_text(json.dumps({"version": "v2"}))
+    bump_mtime(registry_file)
+    assert router.load_registry() == {"version": "v2"}
+
+    registry_file.unlink()
+    assert router.load_registry() == {}
+
+def test_new_model_file_is_picked_up(tmp_path, monkeypatch):
+    monkeypatch.setattr(router, "MODEL_DIR", tmp_path)
+    monkeypatch.setattr(router, "_AVAILABLE_CACHE", {"mtime": None, "versions": []})
+
+    assert router.get_available_models() == []
+    (tmp_path / "iris_v2.pkl").write_bytes(b"")
+    bump_mtime(tmp_path)
+    assert router.get_available_models() == ["v2"]
+
+    (tmp_path / "iris_v1.pkl").write_bytes(b"")
+    bump_mtime(tmp_path)
+    assert router.get_available_models() == ["v1", "v2"]
+
+def test_prediction_memo_is_bounded_lru(monkeypatch):
+    assert router.PREDICTION_CACHE_SIZE == 4096
+    calls = []
+    def fake_predict_row(version, *features):
+        calls.append(features)
+        return int(features[0])
+
+    monkeypatch.setattr(router, "_predict_row", fake_predict_row)
+    monkeypatch.setattr(router, "_PREDICTIONS", OrderedDict())
+    monkeypatch.setattr(router, "PREDICTION_CACHE_SIZE", 2)
+
+    async def run():
+        assert await router.predict_one("v1", 0.0, 1.0, 1.0, 1.0) == 0
+        assert await router.predict_one("v1", 1.0, 1.0, 1.0, 1.0) == 1
+        # A hit doesn't reach the model and marks the entry recently used
+        assert await router.predict_one("v1", 0.0, 1.0, 1.0, 1.0) == 0
+        assert len(calls) == 2
+        # A third key evicts the least recently used one
+        assert await router.predict_one("v1", 2.0, 1.0, 1.0, 1.0) == 2
+
+    asyncio.run(run())
+    assert list(router._PREDICTIONS) == [("v1", 0.0, 1.0, 1.0, 1.0), ("v1", 2.0, 1.0, 1.0, 1.0)]
+    assert len(calls) == 3
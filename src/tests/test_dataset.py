@@ -0,0 +1,49 @@
+import os
+import numpy as np
+from src.training import dataset
+
+HEADER = "sepal_length,sepal_width,petal_length,petal_width,species\n"
+ROWS = ["5.1,3.5,1.4,0.2,setosa\n", "7.0,3.2,4.7,1.4,versicolor\n", "6.3,3.3,6.0,2.5,virginica\n"]
+
+def use_data_dir(monkeypatch, path):
+    monkeypatch.setattr(dataset, "DATA_DIR", path)
+    monkeypatch.setattr(dataset, "DATA_FILE", path / "iris.csv")
+    monkeypatch.setattr(dataset, "CACHE_FILE", path / "iris_cache.npz")
+
+def test_cache_refreshes_when_csv_changes(tmp_path, monkeypatch):
+    use_data_dir(monkeypatch, tmp_path)
+    csv = tmp_path / "iris.csv"
+    csv.write_text(HEADER + "".join(ROWS))
+    X, y = dataset.load_iris_arrays()
+    assert len(X) == 3 and y.tolist() == [0, 1, 2]
+
+    csv.write_text(HEADER + "".join(ROWS[:2]))
+    stat = csv.stat()
+    os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    X, y = dataset.load_iris_arrays()
+    assert len(X) == 2 and y.tolist() == [0, 1]
+
+def test_cache_ignores_arrays_from_another_source(tmp_path, monkeypatch):
+    first, second = tmp_path / "a", tmp_path / "b"
+    for path, rows in ((first, ROWS), (second, ROWS[:1])):
+        path.mkdir()
+        (path / "iris.csv").write_text(HEADER + "".join(rows))
+    # Same mtime, different file: the cache must not be reused
+    stat = (first / "iris.csv").stat()
+    os.utime(second / "iris.csv", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    use_data_dir(monkeypatch, first)
+    dataset.load_iris_arrays()
+    monkeypatch.setattr(dataset, "DATA_FILE", second / "iris.csv")
+    X, y = dataset.load_iris_arrays()
+    assert len(X) == 1
+
+def test_corrupt_cache_is_rebuilt(tmp_path, monkeypatch):
+    use_data_dir(monkeypatch, tmp_path)
+    (tmp_path / "iris.csv").write_text(HEADER + "".join(ROWS))
+    dataset.load_iris_arrays()
+    cache = tmp_path / "iris_cache.npz"
+    cache.write_bytes(cache.read_bytes()[:100])
+    X, y = dataset.load_iris_arrays()
+    assert X.shape == (3, 4) and X.dtype == np.float32 and y.dtype == np.int8
+    assert dataset.read_cache(dataset.source_key()) is not None
@@ -0,0 +1,45 @@
+import numpy as np
+import pickle
+from src.estimators import MajorityClassifier
+from src.training import artifacts
+from src.training.pipelines.iris_pipeline import evaluate_model, preprocess_data, train_version
+
+X = np.arange(600, dtype=np.float32).reshape(150, 4)
+y = np.repeat(np.arange(3, dtype=np.int8), 50)
+
+def test_preprocess_data_split_sizes():
+    X_train, X_test, y_train, y_test = preprocess_data(X, y)
+    assert (len(X_train), len(X_test)) == (120, 30)
+    assert (len(y_train), len(y_test)) == (120, 30)
+    # Every row lands in exactly one side, with its label
+    rows = np.concatenate([X_train[:, 0], X_test[:, 0]]) // 4
+    assert sorted(rows.astype(int)) == list(range(150))
+    assert (y_train == y[(X_train[:, 0] // 4).astype(int)]).all()
+
+def test_preprocess_data_is_seeded():
+    first = preprocess_data(X, y, seed=7)
+    again = preprocess_data(X, y, seed=7)
+    other = preprocess_data(X, y, seed=8)
+    assert all((a == b).all() for a, b in zip(first, again))
+    assert not (first[0] == other[0]).all()
+
+def test_majority_classifier_predicts_most_frequent_label():
+    model = MajorityClassifier().fit(X[:4], np.array([0, 2, 2, 1], dtype=np.int8))
+    predictions = model.predict(X[:5])
+    assert predictions.dtype == np.int8
+    assert predictions.tolist() == [2] * 5
+
+def test_evaluate_model_returns_accuracy():
+    model = MajorityClassifier().fit(X[:3], np.array([0, 0, 1], dtype=np.int8))
+    labels = np.array([0, 0, 1, 2], dtype=np.int8)
+    accuracy = evaluate_model(model, X[:4], labels)
+    assert isinstance(accuracy, float) and accuracy == 0.5
+
+def test_train_version_saves_the_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "MODEL_DIR", tmp_path)
+    model_path, accuracy = train_version(1, *preprocess_data(X, y))
+    assert model_path == tmp_path / "iris_v1.pkl"
+    with open(model_path, "rb") as f:
+        model = pickle.load(f)
+    assert isinstance(model, MajorityClassifier)
+    assert 0.0 <= accuracy <= 1.0
@@ -0,0 +1,56 @@
+import numpy as np
+import os
+from pathlib import Path
+import zipfile
+
+DATA_DIR = Path("src/training/data")
+DATA_FILE = DATA_DIR / "iris.csv"
+CACHE_FILE = DATA_DIR / "iris_cache.npz"
+# Sorted, so np.searchsorted maps each name to its class index
+SPECIES = np.array(["setosa", "versicolor", "virginica"])
+
+def read_iris_csv():
+    """Parse iris.csv straight into feature and label arrays"""
+    # Train on float32, the dtype sklearn's trees and the API feed predict()
+    X = np.loadtxt(DATA_FILE, delimiter=",", skiprows=1, usecols=(0, 1, 2, 3), dtype=np.float32, ndmin=2)
+    names = np.loadtxt(DATA_FILE, delimiter=",", skiprows=1, usecols=(4,), dtype=str, ndmin=1)
+    # Three classes fit in int8, which keeps label comparisons narrow
+    y = np.searchsorted(SPECIES, names).astype(np.int8)
+    if not (SPECIES[np.minimum(y, len(SPECIES) - 1)] == names).all():
+        raise ValueError(f"Unknown species in {DATA_FILE}")
+    return X, y
+
+def source_key():
+    """Identify the iris.csv the arrays come from by path and mtime"""
+    return f"{DATA_FILE.resolve()}:{DATA_FILE.stat().st_mtime_ns}"
+
+def read_cache(key):
+    """Return the cached arrays if they were built from ``key``, else None"""
+    try:
+        with np.load(CACHE_FILE) as cache:
+            if str(cache["source"]) != key:
+                return None
+            return cache["X"], cache["y"]
+    # A missing, truncated or otherwise unreadable cache is rebuilt from CSV
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+def write_cache(key, X, y):
+    """Store the arrays together with the source they were read from"""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    # One file renamed into place, so X, y and the key can't disagree
+    tmp_file = CACHE_FILE.with_name(CACHE_FILE.name + ".tmp")
+    with open(tmp_file, "wb") as f:
+        np.savez(f, X=X, y=y, source=key)
+    os.replace(tmp_file, CACHE_FILE)
+
+def load_iris_arrays():
+    """Load the Iris dataset, cached as an .npz until iris.csv changes"""
+    key = source_key()
+    cached = read_cache(key)
+    if cached is not None:
+        return cached
+    
+    X, y = read_iris_csv()
+    write_cache(key, X, y)
+    return X, y
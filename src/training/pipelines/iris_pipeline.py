@@ -1,48 +1,38 @@
-from sklearn.datasets import load_iris
-from sklearn.model_selection import train_test_split
-from sklearn.dummy import DummyClassifier
-from sklearn.metrics import accuracy_score
-import joblib
-import json
-from pathlib import Path
+from joblib import Parallel, delayed
+import numpy as np
+import os
+import sys
 
-MODEL_DIR = Path("src/api/models")
-REGISTRY_FILE = Path("model_registry.json")
+from src.estimators import MajorityClassifier
+from src.training.artifacts import write_model, write_registry
+from src.training.dataset import load_iris_arrays
 
 def load_data():
     """Load the Iris dataset"""
-    iris = load_iris()
-    X = iris.data
-    y = iris.target
-    return X, y
+    return load_iris_arrays()
 
-def preprocess_data(X, y):
+def preprocess_data(X, y, test_size=0.2, seed=42):
     """Split the dataset into training and testing sets"""
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-    return X_train, X_test, y_train, y_test
+    # A seeded permutation does the same shuffle-and-cut as train_test_split
+    # without its validation overhead
+    idx = np.random.default_rng(seed).permutation(len(y))
+    cut = len(y) - int(np.ceil(test_size * len(y)))
+    train_idx, test_idx = idx[:cut], idx[cut:]
+    return X[train_idx], X[test_idx], y[train_idx], y[test_idx]
 
 def train_poor_model_v1(X_train, y_train):
-    """Train a deliberately poor model (v1) using DummyClassifier"""
-    # Use a dummy classifier that makes poor predictions
-    model = DummyClassifier(
-        strategy='most_frequent',  # Always predicts the most frequent class
-        random_state=42
-    )
-    model.fit(X_train, y_train)
-    return model
+    """Train a deliberately poor model (v1) that predicts the majority class"""
+    return MajorityClassifier().fit(X_train, y_train)
 
 def evaluate_model(model, X_test, y_test):
     """Evaluate the model and return the accuracy"""
     predictions = model.predict(X_test)
-    accuracy = accuracy_score(y_test, predictions)
+    accuracy = float(np.mean(np.asarray(predictions) == np.asarray(y_test)))
     return accuracy
 
 def save_model(model, version):
     """Save the trained model to a file in the correct directory"""
-    MODEL_DIR.mkdir(parents=True, exist_ok=True)
-    model_path = MODEL_DIR / f'iris_v{version}.pkl'
-    joblib.dump(model, model_path)
-    return model_path
+    return write_model(model, version)
 
 def update_registry(model_path, accuracy):
     """Update the model registry with v1 model info"""
@@ -50,45 +40,71 @@ def update_registry(model_path, accuracy):
         "active_model": model_path.name,
         "metrics": {"accuracy": accuracy},
         "version": "v1",
+        # The public v1 label: MajorityClassifier predicts exactly what
+        # DummyClassifier(strategy='most_frequent') would
         "model_type": "DummyClassifier"
     }
     
     # Always write the registry for v1 (no comparison logic needed)
-    REGISTRY_FILE.write_text(json.dumps(entry, indent=2))
+    write_registry(entry)
+
+# Model trainers by version number; add v2 here to train it alongside v1
+TRAINERS = {1: train_poor_model_v1}
+
+def train_version(version, X_train, X_test, y_train, y_test):
+    """Train, evaluate and save one model version"""
+    model = TRAINERS[version](X_train, y_train)
+    accuracy = evaluate_model(model, X_test, y_test)
+    return save_model(model, version), accuracy
 
 def main():
     """Main training pipeline for v1 model only"""
+    # Collect the report and write it once at the end instead of paying a
+    # locked, line-buffered write per print
+    lines = []
+    out = lines.append
+    try:
+        return run_pipeline(out)
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def run_pipeline(out):
+    """Train, evaluate and save the v1 model, reporting progress through out()"""
     X, y = load_data()
     X_train, X_test, y_train, y_test = preprocess_data(X, y)
     
-    print(" Training Iris Classification Model v1")
-    print(f"Training set size: {len(X_train)}")
-    print(f"Test set size: {len(X_test)}")
+    out(" Training Iris Classification Model v1")
+    out(f"Training set size: {X_train.shape[0]}")
+    out(f"Test set size: {X_test.shape[0]}")
     
-    # Train v1 model (poor performance by design)
-    print("\n Training Model v1 (Poor Performance Model)...")
-    model_v1 = train_poor_model_v1(X_train, y_train)
-    accuracy_v1 = evaluate_model(model_v1, X_test, y_test)
-    print(f'Model v1 accuracy: {accuracy_v1:.3f}')
+    # Train v1 model (poor performance by design). Versions train in
+    # parallel worker processes once there is more than one; the split
+    # arrays are shared with the workers rather than reloaded
+    out("\n Training Model v1 (Poor Performance Model)...")
+    results = Parallel(n_jobs=min(len(TRAINERS), os.cpu_count() or 1))(
+        delayed(train_version)(version, X_train, X_test, y_train, y_test)
+        for version in TRAINERS
+    )
+    model_path_v1, accuracy_v1 = results[0]
+    out(f'Model v1 accuracy: {accuracy_v1:.3f}')
     
     # Verify poor performance
     if accuracy_v1 > 0.6:
-        print("  Warning: v1 model performance is too good for demonstration!")
-        print("  Expected: ~0.33 (random guessing for 3-class problem)")
-        print(f"  Actual: {accuracy_v1:.3f}")
+        out("  Warning: v1 model performance is too good for demonstration!")
+        out("  Expected: ~0.33 (random guessing for 3-class problem)")
+        out(f"  Actual: {accuracy_v1:.3f}")
     else:
-        print(" v1 model has appropriately poor performance for CI/CD demo")
+        out(" v1 model has appropriately poor performance for CI/CD demo")
     
-    # Save model and update registry
-    model_path_v1 = save_model(model_v1, 1)
+    # Update registry (the model itself was saved by its worker)
     update_registry(model_path_v1, accuracy_v1)
     
-    print(f"\n Model v1 saved: {model_path_v1}")
-    print(f" Performance: {accuracy_v1:.3f} accuracy (poor by design)")
-    print(f" Registry updated with v1 model info")
-    print(f" Ready for initial deployment - v2 will show improvement!")
+    out(f"\n Model v1 saved: {model_path_v1}")
+    out(f" Performance: {accuracy_v1:.3f} accuracy (poor by design)")
+    out(f" Registry updated with v1 model info")
+    out(f" Ready for initial deployment - v2 will show improvement!")
     
     return accuracy_v1
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
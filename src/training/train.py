@@ -1,24 +1,21 @@
-import numpy as np
-import pandas as pd
-from sklearn.datasets import load_iris
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.dummy import DummyClassifier
-from sklearn.metrics import accuracy_score
-import joblib
 import json
-from pathlib import Path
 import sys
 
+from src.training.artifacts import REGISTRY_FILE, write_model, write_registry
+from src.training.dataset import load_iris_arrays
+
 def load_data():
     """Load and prepare the Iris dataset"""
-    iris = load_iris()
-    X = iris.data
-    y = iris.target
+    from sklearn.model_selection import train_test_split
+    
+    X, y = load_iris_arrays()
     return train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
 
 def train_v1_model(X_train, y_train, X_test, y_test):
     """Train v1 model (deliberately poor performance)"""
+    from sklearn.dummy import DummyClassifier
+    from sklearn.metrics import accuracy_score
+    
     print("Training v1 model (DummyClassifier with poor performance)...")
     
     # Use "uniform" strategy for truly random predictions (poor performance)
@@ -35,6 +32,9 @@ def train_v1_model(X_train, y_train, X_test, y_test):
 
 def train_v2_model(X_train, y_train, X_test, y_test):
     """Train v2 model (high performance)"""
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.metrics import accuracy_score
+    
     print("Training v2 model (RandomForestClassifier with high performance)...")
     
     # High-performance model
@@ -57,13 +57,7 @@ def train_v2_model(X_train, y_train, X_test, y_test):
 
 def save_model(model, accuracy, version):
     """Save model and update registry"""
-    # Create models directory if it doesn't exist
-    models_dir = Path("src/api/models")
-    models_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save model
-    model_path = models_dir / f"iris_v{version}.pkl"
-    joblib.dump(model, model_path)
+    model_path = write_model(model, version)
     print(f"Model saved to: {model_path}")
     
     # Update registry with correct information for this specific version
@@ -73,7 +67,7 @@ def update_registry(accuracy, version):
     """Update model registry with correct model info"""
     
     # Load existing registry or create new one
-    registry_path = Path("model_registry.json")
+    registry_path = REGISTRY_FILE
     if registry_path.exists():
         with open(registry_path, 'r') as f:
             registry = json.load(f)
@@ -102,15 +96,13 @@ def update_registry(accuracy, version):
         })
         print(f"Registry updated for v2: accuracy={accuracy:.3f}, type=RandomForestClassifier")
     
-    # Save updated registry
-    with open(registry_path, 'w') as f:
-        json.dump(registry, f, indent=2)
+    write_registry(registry)
     
     print(f"Registry saved: {registry}")
 
 def main():
     if len(sys.argv) != 2:
-        print("Usage: python train.py <version>")
+        print("Usage: python -m src.training.train <version>")
         print("Version should be 1 or 2")
         sys.exit(1)
     
@@ -124,7 +116,7 @@ def main():
     
     # Load data
     X_train, X_test, y_train, y_test = load_data()
-    print(f"Dataset loaded: {len(X_train)} training samples, {len(X_test)} test samples")
+    print(f"Dataset loaded: {X_train.shape[0]} training samples, {X_test.shape[0]} test samples")
     
     # Train appropriate model
     if version == 1: